@@ -36,6 +36,9 @@ __version__ = '0.8.0'
 
 KNOWN_METADATA_VERSIONS = {'2.1', '2.2', '2.3'}
 
+_LICENSE_KEYS = frozenset({'file', 'text'})
+_README_KEYS = frozenset({'content-type', 'file', 'text'})
+
 
 class ConfigurationError(Exception):
     """Error in the backend metadata."""
@@ -52,6 +55,8 @@ class ConfigurationError(Exception):
 class RFC822Message:
     """Python-flavored RFC 822 message implementation."""
 
+    __slots__ = ('body', 'headers')
+
     def __init__(self) -> None:
         self.headers: collections.OrderedDict[str, list[str]] = (
             collections.OrderedDict()
@@ -61,21 +66,22 @@ class RFC822Message:
     def __setitem__(self, name: str, value: str | None) -> None:
         if not value:
             return
-        if name not in self.headers:
-            self.headers[name] = []
-        self.headers[name].append(value)
+        self.headers.setdefault(name, []).append(value)
 
     def __str__(self) -> str:
-        text = ''
+        parts = []
         for name, entries in self.headers.items():
             for entry in entries:
+                if '\n' not in entry:
+                    parts.append(f'{name}: {entry}\n')
+                    continue
                 lines = entry.strip('\n').split('\n')
-                text += f'{name}: {lines[0]}\n'
+                parts.append(f'{name}: {lines[0]}\n')
                 for line in lines[1:]:
-                    text += ' ' * 8 + line + '\n'
+                    parts.append(' ' * 8 + line + '\n')
         if self.body:
-            text += '\n' + self.body
-        return text
+            parts.append('\n' + self.body)
+        return ''.join(parts)
 
     def __bytes__(self) -> bytes:
         return str(self).encode()
@@ -117,7 +123,7 @@ class DataFetcher:
             val = self.get(key)
             if not isinstance(val, list):
                 msg = f'Field "{key}" has an invalid type, expecting a list of strings (got "{val}")'
-                raise ConfigurationError(msg, key=val)
+                raise ConfigurationError(msg, key=key)
             for item in val:
                 if not isinstance(item, str):
                     msg = f'Field "{key}" contains item with invalid type, expecting a string (got "{item}")'
@@ -143,14 +149,10 @@ class DataFetcher:
     def get_people(self, key: str) -> list[tuple[str, str]]:
         try:
             val = self.get(key)
-            if not (
-                isinstance(val, list)
-                and all(isinstance(x, dict) for x in val)
-                and all(
-                    isinstance(item, str)
-                    for items in [_dict.values() for _dict in val]
-                    for item in items
-                )
+            if not isinstance(val, list) or not all(
+                isinstance(entry, dict)
+                and all(isinstance(item, str) for item in entry.values())
+                for entry in val
             ):
                 msg = (
                     f'Field "{key}" has an invalid type, expecting a list of '
@@ -389,42 +391,37 @@ class StandardMetadata:
 
         _license = fetcher.get_dict('project.license')
         for field in _license:
-            if field not in ('file', 'text'):
+            if field not in _LICENSE_KEYS:
                 msg = f'Unexpected field "project.license.{field}"'
                 raise ConfigurationError(msg, key=f'project.license.{field}')
 
-        file: pathlib.Path | None = None
         filename = fetcher.get_str('project.license.file')
         text = fetcher.get_str('project.license.text')
 
-        if (filename and text) or (not filename and not text):
+        if text and not filename:
+            return License(text, None)
+
+        if not filename or text:
             msg = f'Invalid "project.license" value, expecting either "file" or "text" (got "{_license}")'
             raise ConfigurationError(msg, key='project.license')
 
-        if filename:
-            file = project_dir.joinpath(filename)
-            if not file.is_file():
-                msg = f'License file not found ("{filename}")'
-                raise ConfigurationError(msg, key='project.license.file')
-            text = file.read_text(encoding='utf-8')
-
-        assert text is not None
-        return License(text, file)
+        file = project_dir.joinpath(filename)
+        if not file.is_file():
+            msg = f'License file not found ("{filename}")'
+            raise ConfigurationError(msg, key='project.license.file')
+        return License(file.read_text(encoding='utf-8'), file)
 
     @staticmethod
     def _get_readme(fetcher: DataFetcher, project_dir: pathlib.Path) -> Readme | None:  # noqa: C901
         if 'project.readme' not in fetcher:
             return None
 
-        filename: str | None
-        file: pathlib.Path | None = None
-        text: str | None
+        filename: str
         content_type: str | None
 
         readme = fetcher.get('project.readme')
         if isinstance(readme, str):
             # readme is a file
-            text = None
             filename = readme
             if filename.endswith('.md'):
                 content_type = 'text/markdown'
@@ -436,11 +433,11 @@ class StandardMetadata:
         elif isinstance(readme, dict):
             # readme is a dict containing either 'file' or 'text', and content-type
             for field in readme:
-                if field not in ('content-type', 'file', 'text'):
+                if field not in _README_KEYS:
                     msg = f'Unexpected field "project.readme.{field}"'
                     raise ConfigurationError(msg, key=f'project.readme.{field}')
             content_type = fetcher.get_str('project.readme.content-type')
-            filename = fetcher.get_str('project.readme.file')
+            filename = fetcher.get_str('project.readme.file') or ''
             text = fetcher.get_str('project.readme.text')
             if (filename and text) or (not filename and not text):
                 msg = f'Invalid "project.readme" value, expecting either "file" or "text" (got "{readme}")'
@@ -448,6 +445,8 @@ class StandardMetadata:
             if not content_type:
                 msg = 'Field "project.readme.content-type" missing'
                 raise ConfigurationError(msg, key='project.readme.content-type')
+            if text:
+                return Readme(text, None, content_type)
         else:
             msg = (
                 f'Field "project.readme" has an invalid type, expecting either, '
@@ -455,15 +454,11 @@ class StandardMetadata:
             )
             raise ConfigurationError(msg, key='project.readme')
 
-        if filename:
-            file = project_dir.joinpath(filename)
-            if not file.is_file():
-                msg = f'Readme file not found ("{filename}")'
-                raise ConfigurationError(msg, key='project.readme.file')
-            text = file.read_text(encoding='utf-8')
-
-        assert text is not None
-        return Readme(text, file, content_type)
+        file = project_dir.joinpath(filename)
+        if not file.is_file():
+            msg = f'Readme file not found ("{filename}")'
+            raise ConfigurationError(msg, key='project.readme.file')
+        return Readme(file.read_text(encoding='utf-8'), file, content_type)
 
     @staticmethod
     def _get_dependencies(fetcher: DataFetcher) -> list[Requirement]:
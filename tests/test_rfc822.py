@@ -11,30 +11,30 @@ import pyproject_metadata
     ('items', 'data'),
     [
         # empty
-        ([], ''),
+        ([], b''),
         # simple
         (
             [
                 ('Foo', 'Bar'),
             ],
-            'Foo: Bar\n',
+            b'Foo: Bar\n',
         ),
         (
             [
                 ('Foo', 'Bar'),
                 ('Foo2', 'Bar2'),
             ],
-            """\
+            textwrap.dedent("""\
             Foo: Bar
             Foo2: Bar2
-            """,
+            """).encode(),
         ),
         # None
         (
             [
                 ('Item', None),
             ],
-            '',
+            b'',
         ),
         # order
         (
@@ -43,11 +43,11 @@ import pyproject_metadata
                 ('ItemB', 'ValueB'),
                 ('ItemC', 'ValueC'),
             ],
-            """\
+            textwrap.dedent("""\
             ItemA: ValueA
             ItemB: ValueB
             ItemC: ValueC
-            """,
+            """).encode(),
         ),
         (
             [
@@ -55,11 +55,11 @@ import pyproject_metadata
                 ('ItemC', 'ValueC'),
                 ('ItemA', 'ValueA'),
             ],
-            """\
+            textwrap.dedent("""\
             ItemB: ValueB
             ItemC: ValueC
             ItemA: ValueA
-            """,
+            """).encode(),
         ),
         # multiple keys
         (
@@ -69,12 +69,12 @@ import pyproject_metadata
                 ('ItemC', 'ValueC'),
                 ('ItemA', 'ValueA2'),
             ],
-            """\
+            textwrap.dedent("""\
             ItemA: ValueA1
             ItemA: ValueA2
             ItemB: ValueB
             ItemC: ValueC
-            """,
+            """).encode(),
         ),
         (
             [
@@ -82,13 +82,13 @@ import pyproject_metadata
                 ('ItemB', 'ValueB1\nValueB2\nValueB3'),
                 ('ItemC', 'ValueC'),
             ],
-            """\
+            textwrap.dedent("""\
             ItemA: ValueA
             ItemB: ValueB1
                     ValueB2
                     ValueB3
             ItemC: ValueC
-            """,
+            """).encode(),
         ),
     ],
 )
@@ -98,9 +98,17 @@ def test_headers(items, data):
     for name, value in items:
         message[name] = value
 
-    data = textwrap.dedent(data)
-    assert str(message) == data
-    assert bytes(message) == data.encode()
+    assert bytes(message) == data
+
+
+def test_str_matches_bytes():
+    message = pyproject_metadata.RFC822Message()
+
+    message['ItemA'] = 'ValueA'
+    message['ItemB'] = 'ValueB1\nValueB2'
+    message.body = 'some body 👋\n'
+
+    assert str(message) == bytes(message).decode()
 
 
 def test_body():
@@ -16,16 +16,23 @@ except ImportError:
 
 import pyproject_metadata
 
-from .conftest import cd_package
+from .conftest import cd_package, package_dir
+
+
+FULL_METADATA_DIR = (package_dir / 'full-metadata').resolve(strict=True)
 
 
 @pytest.mark.parametrize(
     ('data', 'error'),
     [
-        ('', 'Section "project" missing in pyproject.toml'),
+        pytest.param(
+            '',
+            'Section "project" missing in pyproject.toml',
+            id='missing-project-section',
+        ),
         # name
-        ('[project]', 'Field "project.name" missing'),
-        (
+        pytest.param('[project]', 'Field "project.name" missing', id='missing-name'),
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = true
@@ -34,9 +41,10 @@ from .conftest import cd_package
             (
                 'Field "project.name" has an invalid type, expecting a string (got "True")'
             ),
+            id='name-bad-type',
         ),
         # dynamic
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = true
@@ -46,9 +54,10 @@ from .conftest import cd_package
                 ]
             """),
             ('Unsupported field "name" in "project.dynamic"'),
+            id='dynamic-name',
         ),
         # version
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -57,8 +66,9 @@ from .conftest import cd_package
             (
                 'Field "project.version" has an invalid type, expecting a string (got "True")'
             ),
+            id='version-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -66,9 +76,10 @@ from .conftest import cd_package
             (
                 'Field "project.version" missing and "version" not specified in "project.dynamic"'
             ),
+            id='version-missing',
         ),
         # license
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -78,8 +89,9 @@ from .conftest import cd_package
             (
                 'Field "project.license" has an invalid type, expecting a dictionary of strings (got "True")'
             ),
+            id='license-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -89,8 +101,9 @@ from .conftest import cd_package
             (
                 'Invalid "project.license" value, expecting either "file" or "text" (got "{}")'
             ),
+            id='license-empty',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -101,8 +114,9 @@ from .conftest import cd_package
                 'Invalid "project.license" value, expecting either "file" '
                 "or \"text\" (got \"{'file': '...', 'text': '...'}\")"
             ),
+            id='license-file-and-text',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -110,8 +124,9 @@ from .conftest import cd_package
                 license = { made-up = ':(' }
             """),
             ('Unexpected field "project.license.made-up"'),
+            id='license-unknown-field',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -121,8 +136,9 @@ from .conftest import cd_package
             (
                 'Field "project.license.file" has an invalid type, expecting a string (got "True")'
             ),
+            id='license-file-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -132,8 +148,9 @@ from .conftest import cd_package
             (
                 'Field "project.license.text" has an invalid type, expecting a string (got "True")'
             ),
+            id='license-text-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -141,9 +158,10 @@ from .conftest import cd_package
                 license = { file = 'this-file-does-not-exist' }
             """),
             ('License file not found ("this-file-does-not-exist")'),
+            id='license-file-missing',
         ),
         # readme
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -154,8 +172,9 @@ from .conftest import cd_package
                 'Field "project.readme" has an invalid type, expecting either, '
                 'a string or dictionary of strings (got "True")'
             ),
+            id='readme-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -165,8 +184,9 @@ from .conftest import cd_package
             (
                 'Invalid "project.readme" value, expecting either "file" or "text" (got "{}")'
             ),
+            id='readme-empty',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -177,8 +197,9 @@ from .conftest import cd_package
                 'Invalid "project.readme" value, expecting either "file" or '
                 "\"text\" (got \"{'file': '...', 'text': '...'}\")"
             ),
+            id='readme-file-and-text',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -186,8 +207,9 @@ from .conftest import cd_package
                 readme = { made-up = ':(' }
             """),
             ('Unexpected field "project.readme.made-up"'),
+            id='readme-unknown-field',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -197,8 +219,9 @@ from .conftest import cd_package
             (
                 'Field "project.readme.file" has an invalid type, expecting a string (got "True")'
             ),
+            id='readme-file-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -208,8 +231,9 @@ from .conftest import cd_package
             (
                 'Field "project.readme.text" has an invalid type, expecting a string (got "True")'
             ),
+            id='readme-text-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -217,8 +241,9 @@ from .conftest import cd_package
                 readme = { file = 'this-file-does-not-exist', content-type = '...' }
             """),
             ('Readme file not found ("this-file-does-not-exist")'),
+            id='readme-file-missing',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -226,8 +251,9 @@ from .conftest import cd_package
                 readme = { file = 'README.md' }
             """),
             ('Field "project.readme.content-type" missing'),
+            id='readme-file-no-content-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -235,9 +261,10 @@ from .conftest import cd_package
                 readme = { text = '...' }
             """),
             ('Field "project.readme.content-type" missing'),
+            id='readme-text-no-content-type',
         ),
         # description
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -247,9 +274,10 @@ from .conftest import cd_package
             (
                 'Field "project.description" has an invalid type, expecting a string (got "True")'
             ),
+            id='description-bad-type',
         ),
         # dependencies
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -259,8 +287,9 @@ from .conftest import cd_package
             (
                 'Field "project.dependencies" has an invalid type, expecting a list of strings (got "some string!")'
             ),
+            id='dependencies-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -272,8 +301,9 @@ from .conftest import cd_package
             (
                 'Field "project.dependencies" contains item with invalid type, expecting a string (got "99")'
             ),
+            id='dependencies-item-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -286,9 +316,10 @@ from .conftest import cd_package
                 'Field "project.dependencies" contains an invalid PEP 508 requirement '
                 'string "definitely not a valid PEP 508 requirement!" '
             ),
+            id='dependencies-invalid-requirement',
         ),
         # optional-dependencies
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -299,8 +330,9 @@ from .conftest import cd_package
                 'Field "project.optional-dependencies" has an invalid type, '
                 'expecting a dictionary of PEP 508 requirement strings (got "True")'
             ),
+            id='optional-dependencies-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -312,8 +344,9 @@ from .conftest import cd_package
                 'Field "project.optional-dependencies.test" has an invalid type, '
                 'expecting a dictionary PEP 508 requirement strings (got "some string!")'
             ),
+            id='optional-dependencies-extra-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -327,8 +360,9 @@ from .conftest import cd_package
                 'Field "project.optional-dependencies.test" has an invalid type, '
                 'expecting a PEP 508 requirement string (got "True")'
             ),
+            id='optional-dependencies-item-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -342,9 +376,10 @@ from .conftest import cd_package
                 'Field "project.optional-dependencies.test" contains an invalid '
                 'PEP 508 requirement string "definitely not a valid PEP 508 requirement!" '
             ),
+            id='optional-dependencies-invalid-requirement',
         ),
         # requires-python
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -354,9 +389,10 @@ from .conftest import cd_package
             (
                 'Field "project.requires-python" has an invalid type, expecting a string (got "True")'
             ),
+            id='requires-python-bad-type',
         ),
         # keywords
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -366,8 +402,9 @@ from .conftest import cd_package
             (
                 'Field "project.keywords" has an invalid type, expecting a list of strings (got "some string!")'
             ),
+            id='keywords-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -379,9 +416,10 @@ from .conftest import cd_package
             (
                 'Field "project.keywords" contains item with invalid type, expecting a string (got "True")'
             ),
+            id='keywords-item-bad-type',
         ),
         # authors
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -392,8 +430,9 @@ from .conftest import cd_package
                 'Field "project.authors" has an invalid type, expecting a list of '
                 'dictionaries containing the "name" and/or "email" keys (got "{}")'
             ),
+            id='authors-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -406,9 +445,10 @@ from .conftest import cd_package
                 'Field "project.authors" has an invalid type, expecting a list of '
                 'dictionaries containing the "name" and/or "email" keys (got "[True]")'
             ),
+            id='authors-item-bad-type',
         ),
         # maintainers
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -419,8 +459,9 @@ from .conftest import cd_package
                 'Field "project.maintainers" has an invalid type, expecting a list of '
                 'dictionaries containing the "name" and/or "email" keys (got "{}")'
             ),
+            id='maintainers-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -433,9 +474,10 @@ from .conftest import cd_package
                 'Field "project.maintainers" has an invalid type, expecting a list of '
                 'dictionaries containing the "name" and/or "email" keys (got "[10]")'
             ),
+            id='maintainers-item-bad-type',
         ),
         # classifiers
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -445,8 +487,9 @@ from .conftest import cd_package
             (
                 'Field "project.classifiers" has an invalid type, expecting a list of strings (got "some string!")'
             ),
+            id='classifiers-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -458,9 +501,10 @@ from .conftest import cd_package
             (
                 'Field "project.classifiers" contains item with invalid type, expecting a string (got "True")'
             ),
+            id='classifiers-item-bad-type',
         ),
         # homepage
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -471,9 +515,10 @@ from .conftest import cd_package
             (
                 'Field "project.urls.homepage" has an invalid type, expecting a string (got "True")'
             ),
+            id='urls-homepage-bad-type',
         ),
         # documentation
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -484,9 +529,10 @@ from .conftest import cd_package
             (
                 'Field "project.urls.documentation" has an invalid type, expecting a string (got "True")'
             ),
+            id='urls-documentation-bad-type',
         ),
         # repository
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -497,9 +543,10 @@ from .conftest import cd_package
             (
                 'Field "project.urls.repository" has an invalid type, expecting a string (got "True")'
             ),
+            id='urls-repository-bad-type',
         ),
         # changelog
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -510,9 +557,10 @@ from .conftest import cd_package
             (
                 'Field "project.urls.changelog" has an invalid type, expecting a string (got "True")'
             ),
+            id='urls-changelog-bad-type',
         ),
         # scripts
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -522,9 +570,10 @@ from .conftest import cd_package
             (
                 'Field "project.scripts" has an invalid type, expecting a dictionary of strings (got "[]")'
             ),
+            id='scripts-bad-type',
         ),
         # gui-scripts
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -534,9 +583,10 @@ from .conftest import cd_package
             (
                 'Field "project.gui-scripts" has an invalid type, expecting a dictionary of strings (got "[]")'
             ),
+            id='gui-scripts-bad-type',
         ),
         # entry-points
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -547,8 +597,9 @@ from .conftest import cd_package
                 'Field "project.entry-points" has an invalid type, '
                 'expecting a dictionary of entrypoint sections (got "[]")'
             ),
+            id='entry-points-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -559,8 +610,9 @@ from .conftest import cd_package
                 'Field "project.entry-points.section" has an invalid type, '
                 'expecting a dictionary of entrypoints (got "something")'
             ),
+            id='entry-points-section-bad-type',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -571,9 +623,10 @@ from .conftest import cd_package
             (
                 'Field "project.entry-points.section.entrypoint" has an invalid type, expecting a string (got "[]")'
             ),
+            id='entry-points-entrypoint-bad-type',
         ),
         # invalid mame
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = '.test'
@@ -583,8 +636,9 @@ from .conftest import cd_package
                 'Invalid project name ".test". A valid name consists only of ASCII letters and '
                 'numbers, period, underscore and hyphen. It must start and end with a letter or number'
             ),
+            id='name-invalid',
         ),
-        (
+        pytest.param(
             textwrap.dedent("""
                 [project]
                 name = 'test'
@@ -595,13 +649,15 @@ from .conftest import cd_package
                 'Field "project.entry-points" has an invalid value, expecting a name containing only '
                 'alphanumeric, underscore, or dot characters (got "bad-name")'
             ),
+            id='entry-points-section-bad-name',
         ),
     ],
 )
-@pytest.mark.usefixtures('package')
 def test_load(data, error):
     with pytest.raises(pyproject_metadata.ConfigurationError, match=re.escape(error)):
-        pyproject_metadata.StandardMetadata.from_pyproject(tomllib.loads(data))
+        pyproject_metadata.StandardMetadata.from_pyproject(
+            tomllib.loads(data), project_dir=FULL_METADATA_DIR
+        )
 
 
 @pytest.mark.parametrize('after_rfc', [False, True])
@@ -776,17 +832,17 @@ def test_as_rfc822_set_metadata(metadata_version):
     )
     assert metadata.metadata_version == metadata_version
 
-    rfc822 = str(metadata.as_rfc822())
+    rfc822 = bytes(metadata.as_rfc822())
 
-    assert f'Metadata-Version: {metadata_version}' in rfc822
+    assert f'Metadata-Version: {metadata_version}'.encode() in rfc822
 
-    assert 'Provides-Extra: under-score' in rfc822
-    assert 'Provides-Extra: da-sh' in rfc822
-    assert 'Provides-Extra: do-t' in rfc822
-    assert 'Provides-Extra: empty' in rfc822
-    assert 'Requires-Dist: some_package; extra == "under-score"' in rfc822
-    assert 'Requires-Dist: some-package; extra == "da-sh"' in rfc822
-    assert 'Requires-Dist: some.package; extra == "do-t"' in rfc822
+    assert b'Provides-Extra: under-score' in rfc822
+    assert b'Provides-Extra: da-sh' in rfc822
+    assert b'Provides-Extra: do-t' in rfc822
+    assert b'Provides-Extra: empty' in rfc822
+    assert b'Requires-Dist: some_package; extra == "under-score"' in rfc822
+    assert b'Requires-Dist: some-package; extra == "da-sh"' in rfc822
+    assert b'Requires-Dist: some.package; extra == "do-t"' in rfc822
 
 
 def test_as_rfc822_set_metadata_invalid():